@@ -395,10 +395,11 @@ def _mk_bitmap(bits, _CODEBITS=_CODEBITS, _int=int):
 
 def _bytes_to_codes(b):
     # Convert block indices to word array
-    a = memoryview(b).cast('I')
-    assert a.itemsize == _sre.CODESIZE
-    assert len(a) * a.itemsize == len(b)
-    return a.tolist()
+    # moonpython: memoryview.cast is not available; build the native-order
+    # (little-endian) words directly.
+    assert len(b) % _sre.CODESIZE == 0
+    return [int.from_bytes(b[i:i + _sre.CODESIZE], 'little')
+            for i in range(0, len(b), _sre.CODESIZE)]
 
 def _simple(p):
     # check if this subpattern is a "simple" operator
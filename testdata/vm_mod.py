@@ -0,0 +1,20 @@
+def twice(func):
+    def wrapper(x):
+        return func(func(x))
+    return wrapper
+
+
+class Counter:
+    total = 0
+
+    @twice
+    def bump(x):
+        return x + 1
+
+
+squares = []
+for i in range(5):
+    squares.append(i * i)
+    Counter.total += i
+
+TOTAL = Counter.total